@@ -45,10 +45,11 @@ class LanglearnApp:
             '0': self.handle_exit
         }
 
+        menu_text = "\nPlease select an option:\n" + "\n".join(
+            f"  {key}. {value.__doc__}" for key, value in menu_options.items())
+
         while True:
-            print("\nPlease select an option:")
-            for key, value in menu_options.items():
-                print(f"  {key}. {value.__doc__}")
+            print(menu_text)
 
             choice = input("Enter your choice (0-9): ").strip()
             action = menu_options.get(choice)
@@ -65,12 +66,14 @@ class LanglearnApp:
         Args:
             flag (str): The command-line flag indicating the operation to be performed.
         """
-        if flag == '-c':
-            directory = '.'
-            FileHandler.check_and_report_duplicates(directory)
-        elif flag == '-d':
-            directory = '.'
-            FileHandler.check_and_report_duplicates(directory, True)
+        handlers = {
+            '-c': lambda: FileHandler.check_and_report_duplicates('.'),
+            '-d': lambda: FileHandler.check_and_report_duplicates('.', True)
+        }
+
+        handler = handlers.get(flag)
+        if handler:
+            handler()
         else:
             LanglearnApp.handle_flag_with_error(flag)
 
@@ -178,8 +181,9 @@ class LanglearnApp:
 
         error_str = "You must provide a file path for "
 
-        if flag in error_messages:
-            full_error_message = error_str + error_messages[flag]
+        error_message = error_messages.get(flag)
+        if error_message:
+            full_error_message = error_str + error_message
             print(f"Error: {full_error_message}")
         else:
             print(f"Error: Unknown flag '{flag}'")
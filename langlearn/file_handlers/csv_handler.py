@@ -1,6 +1,51 @@
 import csv
+import io
+import mmap
 import os
 import random
+import re
+from functools import lru_cache
+from operator import itemgetter
+
+_BUFFER_SIZE = 1024 * 1024
+_COLON_RE = re.compile(r'\s*:\s*')
+_SEMICOLON_RE = re.compile(r'\s*;\s*')
+
+
+@lru_cache(maxsize=8)
+def _cached_rows(file_path, mtime_ns, size, delimiter):
+    """
+    Parse the non-blank lines of a CSV file, caching the result for as long as the file is unchanged.
+
+    Args:
+        file_path (str): The path to the CSV file.
+        mtime_ns (int): The file's modification time; part of the cache key so that edits invalidate it.
+        size (int): The file's size; part of the cache key so that edits invalidate it.
+        delimiter (str): The delimiter used in the CSV file.
+
+    Returns:
+        tuple: A tuple of rows, where each row is a tuple of values from the CSV file.
+    """
+    return _parse_rows(CSVHandler._read_text(file_path), delimiter)
+
+
+def _parse_rows(data, delimiter):
+    """
+    Parse the non-blank lines of CSV text.
+
+    Args:
+        data (str): The contents of a CSV file.
+        delimiter (str): The delimiter used in the CSV file.
+
+    Returns:
+        tuple: A tuple of rows, where each row is a tuple of values from the CSV file.
+    """
+    # Quoted cells can hide the delimiter, and a lone '\r' ends a row, so only files without either can be split
+    # directly. They are split on '\n' alone, since str.splitlines() would also break rows on characters such as
+    # '\x0c' that the csv module keeps inside a cell.
+    if '"' in data or data.count('\r') != data.count('\r\n'):
+        return tuple(tuple(row) for row in csv.reader(io.StringIO(data, newline=''), delimiter=delimiter) if row)
+    return tuple(tuple(record.split(delimiter)) for line in data.split('\n') if (record := line.rstrip('\r')))
 
 
 class CSVHandler:
@@ -25,28 +70,68 @@ class CSVHandler:
         return True
 
     @staticmethod
-    def read_words(file_path, required_columns=1, delimiter=':'):
+    def _read_text(file_path):
         """
-        Reads words from a CSV file and checks for column count consistency.
+        Reads a whole UTF-8 file with a single read and decode.
 
         Args:
-            file_path (str): The path to the CSV file.
+            file_path (str): The path to the file to read.
+
+        Returns:
+            str: The decoded contents of the file.
+        """
+        with open(file_path, 'rb', buffering=_BUFFER_SIZE) as infile:
+            return infile.read().decode('utf-8')
+
+    @staticmethod
+    def read_words_from_fileobj(fileobj, required_columns=1, delimiter=':'):
+        """
+        Reads words from a CSV file that is already open in binary mode and checks for column count consistency.
+        The file is left open.
+
+        Args:
+            fileobj (file): The open CSV file.
             required_columns (int, optional): The expected number of columns in each row (default is 1).
             delimiter (str, optional): The delimiter used in the CSV file (default is ':').
 
-        Returns: list: A list of rows, where each row is a list of values from the CSV file. If the number of columns
-        in a row does not match `required_columns`, an error message is printed and the function returns None.
+        Returns:
+            list: A list of rows, or None if the number of columns in a row does not match `required_columns`.
+        """
+        return CSVHandler._check_columns(_parse_rows(fileobj.read().decode('utf-8'), delimiter), required_columns)
+
+    @staticmethod
+    def _check_columns(rows, required_columns):
+        """
+        Checks that every row has the expected number of columns and copies the rows into lists.
+
+        Args:
+            rows (tuple): The parsed rows.
+            required_columns (int): The expected number of columns in each row.
+
+        Returns:
+            list: A list of rows, or None (after printing an error) if a row has the wrong number of columns.
+        """
+        bad_row = next((row for row in rows if len(row) != required_columns), None)
+        if bad_row is not None:
+            print(f"CSV format error: Expected {required_columns} columns but found {len(bad_row)} in "
+                  f"row {list(bad_row)}")
+            return
+        return [list(row) for row in rows]
+
+    @staticmethod
+    def _load_rows(file_path, delimiter):
         """
-        words = []
-        with open(file_path, newline='', encoding='utf-8') as csvfile:
-            reader = csv.reader(csvfile, delimiter=delimiter)
-            for row in reader:
-                if len(row) != required_columns:
-                    print(f"CSV format error: Expected {required_columns} columns but found {len(row)} in "
-                          f"row {row}")
-                    return
-                words.append(row)
-        return words
+        Returns the parsed rows of a CSV file, reusing the previous parse if the file has not changed since.
+
+        Args:
+            file_path (str): The path to the CSV file.
+            delimiter (str): The delimiter used in the CSV file.
+
+        Returns:
+            tuple: A tuple of rows, where each row is a tuple of values. Shared with the cache, so copy before mutating.
+        """
+        file_stat = os.stat(file_path)
+        return _cached_rows(file_path, file_stat.st_mtime_ns, file_stat.st_size, delimiter)
 
     @staticmethod
     def write_words(translations, output_file_path, delimiter=':'):
@@ -58,15 +143,11 @@ class CSVHandler:
             output_file_path (str): The path to the output CSV file.
             delimiter (str, optional): The delimiter used in the CSV file (default is ':').
         """
-        with open(output_file_path, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile, delimiter=delimiter)
-            for word, translation in translations.items():
-                translation = ' ' + translation
-                writer.writerow([word, translation])
-                csvfile.flush()
+        rows = [[word, ' ' + translation] for word, translation in translations.items()]
+        CSVHandler._bulk_write(output_file_path, rows, delimiter)
 
     @staticmethod
-    def swap_order_csv(input_filename, output_filename, delimiter=':'):
+    def swap_order_csv(input_filename, output_filename, delimiter=':', known_nonempty=False):
         """
         Swap the order of columns in a CSV file.
 
@@ -74,148 +155,258 @@ class CSVHandler:
             input_filename (str): The path to the input CSV file.
             output_filename (str): The path to the output CSV file.
             delimiter (str, optional): The delimiter separating the columns in the CSV file (default is ':').
+            known_nonempty (bool, optional): True if the caller has already checked that the file is not empty.
         """
-        if not CSVHandler._is_file_empty(input_filename):
-            return
+        CSVHandler._transform_csv(input_filename, output_filename, CSVHandler._swap_row, delimiter, known_nonempty,
+                                  f"File '{input_filename}' has been processed and saved as '{output_filename}'",
+                                  f"Error: No valid rows to write to '{output_filename}'.")
 
-        temp_output = []
+    @staticmethod
+    def _swap_row(row):
+        """
+        Swap the two columns of a row, skipping empty rows.
 
-        with open(input_filename, 'r', encoding='utf-8') as infile:
-            reader = csv.reader(infile, delimiter=delimiter)
-            for row in reader:
-                if row:
-                    if len(row) == 2:
-                        row[1] = row[1].strip()
-                        row[0] = ' ' + row[0]
-                        temp_output.append([row[1], row[0]])
-                    else:
-                        print(f"Error: Expected 2 columns but found {len(row)} in row: {row}")
-                        return
+        Args:
+            row (list): The row to process.
 
-        if temp_output:
-            with open(output_filename, 'w', newline='', encoding='utf-8') as outfile:
-                writer = csv.writer(outfile, delimiter=delimiter)
-                writer.writerows(temp_output)
-                outfile.flush()
+        Returns:
+            list: The row with its columns swapped, or None if the row is empty.
 
-            print(f"File '{input_filename}' has been processed and saved as '{output_filename}'")
-        else:
-            print(f"Error: No valid rows to write to '{output_filename}'.")
+        Raises:
+            ValueError: If the row does not have exactly two columns.
+        """
+        if not row:
+            return None
+        if len(row) != 2:
+            raise ValueError(f"Expected 2 columns but found {len(row)} in row: {row}")
+        return [row[1].strip(), ' ' + row[0]]
 
     @staticmethod
-    def shuffle_file_csv(input_file_path, output_file_path):
+    def shuffle_file_csv(input_file_path, output_file_path, known_nonempty=False):
         """
         Shuffle the rows of a CSV file and save the result to a new file.
 
         Args:
             input_file_path (str): The path to the input CSV file.
             output_file_path (str): The path to the output CSV file.
+            known_nonempty (bool, optional): True if the caller has already checked that the file is not empty.
         """
         try:
-            if not CSVHandler._is_file_empty(input_file_path):
+            if not known_nonempty and not CSVHandler._is_file_empty(input_file_path):
                 return
 
-            with open(input_file_path, 'r', newline='', encoding='utf-8') as infile:
-                reader = list(csv.reader(infile))
-
-            reader = [row for row in reader if any(cell.strip() for cell in row)]
+            with open(input_file_path, 'rb') as infile, \
+                    mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                # Quoted cells can span several lines, so such files are shuffled as parsed rows instead.
+                if data.find(b'"') != -1:
+                    shuffled = CSVHandler._shuffle_rows(data, output_file_path)
+                else:
+                    shuffled = CSVHandler._shuffle_lines(data, output_file_path)
 
-            if not reader:
+            if not shuffled:
                 print(f"Error: No valid rows to shuffle in '{input_file_path}'.")
                 return
 
-            random.shuffle(reader)
-
-            with open(output_file_path, 'w', newline='', encoding='utf-8') as outfile:
-                writer = csv.writer(outfile)
-                writer.writerows(reader)
-                outfile.flush()
-
             print(f'File {input_file_path} has been shuffled and saved as {output_file_path}')
 
         except Exception as e:
             print(f"An error occurred: {e}")
 
     @staticmethod
-    def format_file_csv(input_file_path, output_file_path):
+    def _shuffle_lines(data, output_file_path):
+        """
+        Shuffle the lines of a CSV file without quoted cells that have a non-blank cell and write them to a new
+        file.
+
+        Args:
+            data (mmap.mmap): The contents of the input CSV file.
+            output_file_path (str): The path to the output CSV file.
+
+        Returns:
+            bool: True if there were any lines to shuffle, False otherwise.
+        """
+        # Only the start offset of each non-blank line is kept in memory; the lines themselves are sliced out of
+        # the mapping while writing.
+        offsets = []
+        start = 0
+        while start < len(data):
+            end = data.find(b'\n', start)
+            if end == -1:
+                end = len(data)
+            # The same test as for parsed rows: a line is kept if any of its comma-separated cells is not blank.
+            if data[start:end].decode('utf-8').replace(',', '').strip():
+                offsets.append(start)
+            start = end + 1
+
+        if not offsets:
+            return False
+
+        random.Random().shuffle(offsets)
+
+        with open(output_file_path, 'wb', buffering=_BUFFER_SIZE) as outfile:
+            for start in offsets:
+                end = data.find(b'\n', start)
+                outfile.write(data[start:end if end != -1 else len(data)])
+                outfile.write(b'\n')
+        return True
+
+    @staticmethod
+    def _shuffle_rows(data, output_file_path):
+        """
+        Shuffle the non-blank rows of a CSV file that contains quoted cells and write them to a new file.
+
+        Args:
+            data (mmap.mmap): The contents of the input CSV file.
+            output_file_path (str): The path to the output CSV file.
+
+        Returns:
+            bool: True if there were any rows to shuffle, False otherwise.
+        """
+        rows = [row for row in csv.reader(io.StringIO(data[:].decode('utf-8'), newline=''))
+                if any(cell.strip() for cell in row)]
+
+        if not rows:
+            return False
+
+        random.Random().shuffle(rows)
+
+        CSVHandler._bulk_write(output_file_path, rows)
+        return True
+
+    @staticmethod
+    def format_file_csv(input_file_path, output_file_path, known_nonempty=False):
         """
         Format a CSV file by adding a space after each ':' and ';' in each cell.
 
         Args:
             input_file_path (str): The path to the input CSV file.
             output_file_path (str): The path to the output CSV file.
+            known_nonempty (bool, optional): True if the caller has already checked that the file is not empty.
         """
-        try:
-            if not CSVHandler._is_file_empty(input_file_path):
-                return
-
-            temp_output = []
-            with open(input_file_path, 'r', newline='', encoding='utf-8') as infile:
-                reader = csv.reader(infile)
-                for row in reader:
-                    processed_row = [': '.join([cell.strip() for cell in segment.split(':')])
-                                     for segment in row]
-                    processed_row = ['; '.join([cell.strip() for cell in segment.split(';')])
-                                     for segment in processed_row]
+        CSVHandler._transform_csv(input_file_path, output_file_path, CSVHandler._format_row,
+                                  known_nonempty=known_nonempty)
 
-                    if any(cell.strip() for cell in processed_row):
-                        temp_output.append(processed_row)
+    @staticmethod
+    def _format_row(row):
+        """
+        Add a space after each ':' and ';' in each cell of a row, skipping rows that end up blank.
 
-            CSVHandler.save_processed_csv(output_file_path, temp_output)
+        Args:
+            row (list): The row to process.
 
-        except Exception as e:
-            print(f"An error occurred: {e}")
+        Returns:
+            list: The formatted row, or None if all of its cells are blank.
+        """
+        processed_row = [_SEMICOLON_RE.sub('; ', _COLON_RE.sub(': ', cell.strip()).strip()) for cell in row]
+        return processed_row if any(processed_row) else None
 
     @staticmethod
-    def add_delimiter_and_space_extension_csv(input_file_path, output_file_path):
+    def add_delimiter_and_space_extension_csv(input_file_path, output_file_path, known_nonempty=False):
         """
         Process a CSV file to add a delimiter and space to each cell.
 
         Args:
             input_file_path (str): The path to the input CSV file.
             output_file_path (str): The path to the output CSV file where processed data will be saved.
+            known_nonempty (bool, optional): True if the caller has already checked that the file is not empty.
+        """
+        CSVHandler._transform_csv(input_file_path, output_file_path, CSVHandler._add_delimiter_row,
+                                  known_nonempty=known_nonempty)
+
+    @staticmethod
+    def _add_delimiter_row(row):
+        """
+        Strip each cell of a row and append ': ' to it, skipping empty rows.
+
+        Args:
+            row (list): The row to process.
+
+        Returns:
+            list: The processed row, or None if the row is empty.
+        """
+        if not row:
+            return None
+        return [cell + ': ' for cell in map(str.strip, row)]
+
+    @staticmethod
+    def _transform_csv(input_file_path, output_file_path, row_function, delimiter=',', known_nonempty=False,
+                       success_message=None, empty_message=None):
+        """
+        Pass every row of a CSV file through a function and save the results to a new file.
+
+        Args:
+            input_file_path (str): The path to the input CSV file.
+            output_file_path (str): The path to the output CSV file.
+            row_function (callable): Takes a row and returns the processed row, or None to drop it. May raise
+                ValueError to abort processing of a malformed file.
+            delimiter (str, optional): The delimiter used in both CSV files (default is ',').
+            known_nonempty (bool, optional): True if the caller has already checked that the file is not empty.
+            success_message (str, optional): Printed once the file is saved, instead of save_processed_csv's default.
+            empty_message (str, optional): Printed if no rows are left to save, instead of save_processed_csv's
+                default.
         """
         try:
-            if not CSVHandler._is_file_empty(input_file_path):
+            if not known_nonempty and not CSVHandler._is_file_empty(input_file_path):
                 return
 
-            temp_output = []
-            with open(input_file_path, 'r', newline='', encoding='utf-8') as infile:
-                reader = csv.reader(infile)
-                for row in reader:
-                    if row:
-                        processed_row = [cell.strip() + ': ' for cell in row]
-                        temp_output.append(processed_row)
-
-            CSVHandler.save_processed_csv(output_file_path, temp_output)
+            rows = csv.reader(io.StringIO(CSVHandler._read_text(input_file_path), newline=''), delimiter=delimiter)
+            processed_data = [processed_row for processed_row in map(row_function, rows) if processed_row is not None]
 
+        except ValueError as e:
+            print(f"Error: {e}")
+            return
         except Exception as e:
             print(f"An error occurred: {e}")
+            return
+
+        CSVHandler.save_processed_csv(output_file_path, processed_data, delimiter, success_message, empty_message)
 
     @staticmethod
-    def save_processed_csv(output_file_path, processed_data):
+    def save_processed_csv(output_file_path, processed_data, delimiter=',', success_message=None, empty_message=None):
         """
         Save the processed data to a new CSV file.
 
         Args:
             output_file_path (str): The path to the output CSV file where the processed data will be saved.
             processed_data (list): A list of processed rows to be written to the output file.
+            delimiter (str, optional): The delimiter used in the CSV file (default is ',').
+            success_message (str, optional): The message printed once the file is saved.
+            empty_message (str, optional): The message printed if there are no rows to save.
         """
         try:
             if processed_data:
-                with open(output_file_path, 'w', newline='', encoding='utf-8') as outfile:
-                    writer = csv.writer(outfile)
-                    writer.writerows(processed_data)
-                    outfile.flush()
+                CSVHandler._bulk_write(output_file_path, processed_data, delimiter)
 
-                print(f"File has been processed and saved as '{output_file_path}'")
+                print(success_message or f"File has been processed and saved as '{output_file_path}'")
             else:
-                print(f"Error: No valid rows to write to '{output_file_path}'")
+                print(empty_message or f"Error: No valid rows to write to '{output_file_path}'")
         except Exception as e:
             print(f"An error occurred during saving: {e}")
 
     @staticmethod
-    def sort_file_csv(input_file_path, output_file_path, delimiter=':'):
+    def _bulk_write(output_file_path, rows, delimiter=','):
+        """
+        Write rows to a CSV file by joining them into a single string, falling back to csv.writer when a cell
+        contains the delimiter, a quote or a line break and therefore needs quoting.
+
+        Args:
+            output_file_path (str): The path to the output CSV file.
+            rows (list): A list of rows, where each row is a list of cell values.
+            delimiter (str, optional): The delimiter used in the CSV file (default is ',').
+        """
+        lines = [delimiter.join(row) for row in rows]
+        text = '\n'.join(lines) + '\n'
+        needs_quoting = ('"' in text or '\r' in text or text.count('\n') != len(lines)
+                         or any(line.count(delimiter) != len(row) - 1 for line, row in zip(lines, rows)))
+
+        with open(output_file_path, 'w', newline='', encoding='utf-8', buffering=_BUFFER_SIZE) as outfile:
+            if needs_quoting:
+                csv.writer(outfile, delimiter=delimiter, lineterminator='\n').writerows(rows)
+            else:
+                outfile.write(text)
+
+    @staticmethod
+    def sort_file_csv(input_file_path, output_file_path, delimiter=':', known_nonempty=False):
         """
         Sort the rows of a CSV file by the first character of the first column in each row.
 
@@ -223,26 +414,22 @@ class CSVHandler:
             input_file_path (str): The path to the input CSV file.
             output_file_path (str): The path to the output CSV file.
             delimiter (str, optional): The delimiter used in the CSV file (default is ':').
+            known_nonempty (bool, optional): True if the caller has already checked that the file is not empty.
         """
         try:
-            if not CSVHandler._is_file_empty(input_file_path):
+            if not known_nonempty and not CSVHandler._is_file_empty(input_file_path):
                 return
 
-            with open(input_file_path, 'r', newline='', encoding='utf-8') as infile:
-                reader = list(csv.reader(infile, delimiter=delimiter))
-
-            reader = [row for row in reader if any(cell.strip() for cell in row)]
+            decorated = [(row[0].strip().lower(), row) for row in CSVHandler._load_rows(input_file_path, delimiter)
+                         if any(cell.strip() for cell in row)]
 
-            if not reader:
+            if not decorated:
                 print(f"Error: No valid rows to sort in '{input_file_path}'.")
                 return
 
-            reader.sort(key=lambda row: row[0].strip().lower())
+            decorated.sort(key=itemgetter(0))
 
-            with open(output_file_path, 'w', newline='', encoding='utf-8') as outfile:
-                writer = csv.writer(outfile, delimiter=delimiter)
-                writer.writerows(reader)
-                outfile.flush()
+            CSVHandler._bulk_write(output_file_path, [row for _, row in decorated], delimiter)
 
             print(f"File '{input_file_path}' has been sorted and saved as '{output_file_path}'")
 
@@ -1,4 +1,6 @@
 import os
+import stat
+from functools import lru_cache
 
 from langlearn.file_handlers.file_processing import (
     remove_duplicates,
@@ -10,6 +12,30 @@ from langlearn.file_handlers.file_processing import (
     sort_file_extension
 )
 
+_SUPPORTED_EXTENSIONS = {'.txt', '.csv'}
+
+
+@lru_cache(maxsize=256)
+def _resolve_output(input_file_path, suffix):
+    """
+    Build the output file path for an input file and a suffix.
+
+    Args:
+        input_file_path (str): The path to the input file.
+        suffix (str): The suffix to be added to the file name.
+
+    Returns:
+        tuple: (output_file_path, error_message), where exactly one of the two is None.
+    """
+    base, file_extension = os.path.splitext(input_file_path)
+
+    if not file_extension:
+        return None, "Error: The input file must have a valid extension."
+    elif file_extension not in _SUPPORTED_EXTENSIONS:
+        return None, f"Unsupported file extension: {file_extension}"
+
+    return f"{base}_{suffix}{file_extension}", None
+
 
 class FileHandler:
     """
@@ -101,17 +127,26 @@ class FileHandler:
         if not input_file_path:
             input_file_path = input("Enter the file path: ").strip()
 
-        if not os.path.isfile(input_file_path):
+        try:
+            file_stat = os.stat(input_file_path)
+        except OSError:
+            file_stat = None
+
+        if file_stat is None or not stat.S_ISREG(file_stat.st_mode):
             print(f"Error: The file '{input_file_path}' does not exist.")
             return
 
+        if not file_stat.st_size:
+            print(f"Error: The file '{input_file_path}' is empty.")
+            return
+
         output_file_path = FileHandler.get_output_file_path(input_file_path, suffix)
 
         if output_file_path is None:
             print("Error generating output file path.")
             return
 
-        process_function(input_file_path, output_file_path)
+        process_function(input_file_path, output_file_path, known_nonempty=True)
 
     @staticmethod
     def _get_directory():
@@ -133,15 +168,11 @@ class FileHandler:
             suffix (str): The suffix to be added to the file name.
 
         Returns:
-            str: The path to the output file.
+            str: The path to the output file, or None if the input file has an unsupported extension.
         """
-        base, file_extension = os.path.splitext(input_file_path)
+        output_file_path, error_message = _resolve_output(input_file_path, suffix)
 
-        if not file_extension:
-            print("Error: The input file must have a valid extension.")
-            return None
-        elif file_extension not in ['.txt', '.csv']:
-            print(f"Unsupported file extension: {file_extension}")
-            return None
+        if error_message:
+            print(error_message)
 
-        return f"{base}_{suffix}{file_extension}"
+        return output_file_path
@@ -1,8 +1,55 @@
 import os
+import shutil
+import tempfile
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
+from langlearn.utils.file_utils import TXT_EXTS, iter_valid_files
 from .txt_handler import TXTHandler
 from .csv_handler import CSVHandler
 
+_PARALLEL_SCAN_MIN_FILES = 4
+_SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+_REWRITE_BUFFER_SIZE = 256 * 1024
+# The operations that check for an empty input file before reading it, and can skip that check when told the file
+# is known not to be empty. The others only find out while reading the file, so there is nothing for them to skip.
+_EMPTY_CHECKING_OPERATIONS = frozenset({
+    TXTHandler.swap_order_txt,
+    CSVHandler.swap_order_csv,
+    CSVHandler.shuffle_file_csv,
+    CSVHandler.format_file_csv,
+    CSVHandler.add_delimiter_and_space_extension_csv,
+    CSVHandler.sort_file_csv
+})
+
+
+def _scan_file(file_path):
+    """
+    Read the first column of every line in a file.
+
+    Args:
+        file_path (str): The path to the file to scan.
+
+    Returns:
+        list: (first_column, line_number) tuples for each line with a non-empty first column.
+    """
+    entries = []
+
+    with open(file_path, 'r', encoding='utf-8') as f:
+        text = f.read()
+
+    # Split on '\n' only; str.splitlines() would also break on characters such as '\x0c' and shift the line numbers.
+    for line_num, line in enumerate(text.split('\n'), 1):
+        end = line.find('|')
+        if end == -1:
+            end = line.find(':')
+
+        first_column = (line[:end] if end != -1 else line).strip()
+        if first_column:
+            entries.append((first_column, line_num))
+
+    return entries
+
 
 def check_repeated_columns(directory):
     """
@@ -12,7 +59,7 @@ def check_repeated_columns(directory):
         directory (str): The directory to check for duplicates.
 
     Returns:
-        tuple: (has_repeats, occurrences)
+        tuple: (has_repeats, occurrences), where occurrences maps each value to a sequence of file-line tuples.
     """
     if not os.path.isdir(directory):
         print(f"Error: The path '{directory}' is not a directory.")
@@ -21,44 +68,41 @@ def check_repeated_columns(directory):
     occurrences = {}
     has_repeats = False
 
-    files = [f for f in os.listdir(directory) if os.path.isfile(os.path.join(directory, f)) and f.endswith('.txt')]
+    file_paths = list(iter_valid_files(directory, TXT_EXTS))
 
-    if not files:
+    if not file_paths:
         print("No .txt files found in the specified directory.")
         return has_repeats, occurrences
 
-    for file in files:
-        file_path = os.path.join(directory, file)
-
-        print(f"Processing file: {file}")
-
-        with open(file_path, 'r') as f:
-            lines = f.readlines()
-            for line_num, line in enumerate(lines):
-                if '|' in line:
-                    parts = line.strip().split('|')
-                elif ':' in line:
-                    parts = line.strip().split(':')
-                else:
-                    parts = [line.strip()]
-
-                if len(parts) == 0 or parts[0] == '':
-                    continue
-
-                first_column = parts[0].strip()
-                if first_column in occurrences:
-                    occurrences[first_column].append((file, line_num + 1))
-                    has_repeats = True
-                else:
-                    occurrences[first_column] = [(file, line_num + 1)]
+    if len(file_paths) < _PARALLEL_SCAN_MIN_FILES:
+        scanned_files = map(_scan_file, file_paths)
+    else:
+        # Threads overlap the file reads without the start-up and pickling cost of worker processes.
+        with ThreadPoolExecutor(max_workers=min(_SCAN_WORKERS, len(file_paths))) as executor:
+            scanned_files = list(executor.map(_scan_file, file_paths))
+
+    for file_path, entries in zip(file_paths, scanned_files):
+        file_name = os.path.basename(file_path)
+        print(f"Processing file: {file_name}")
+
+        for first_column, line_num in entries:
+            files_lines = occurrences.get(first_column)
+            if files_lines is None:
+                # Most values occur only once, so they get a one-element tuple and only repeats pay for a list.
+                occurrences[first_column] = ((file_name, line_num),)
+            elif type(files_lines) is tuple:
+                occurrences[first_column] = [files_lines[0], (file_name, line_num)]
+                has_repeats = True
+            else:
+                files_lines.append((file_name, line_num))
 
     if has_repeats:
-        print("Duplicates found:")
+        report = ["Duplicates found:"]
         for column, files_lines in occurrences.items():
             if len(files_lines) > 1:
-                print(f"Value '{column}' appears in:")
-                for file, line in files_lines:
-                    print(f"  File: {file}, Line: {line}")
+                report.append(f"Value '{column}' appears in:")
+                report.extend(f"  File: {file}, Line: {line}" for file, line in files_lines)
+        print('\n'.join(report))
     else:
         print("OK - No duplicates found in the first columns.")
 
@@ -86,7 +130,7 @@ def confirm_and_update_occurrences(directory, occurrences):
 
     Args:
         directory (str): The directory containing the files.
-        occurrences (dict): A dictionary with words as keys and lists of file-line tuples as values.
+        occurrences (dict): A dictionary with words as keys and sequences of file-line tuples as values.
     """
     while True:
         confirm = input(
@@ -111,7 +155,7 @@ def update_occurrences(directory, occurrences):
 
     Args:
         directory (str): The directory containing the files.
-        occurrences (dict): A dictionary with words as keys and lists of file-line tuples as values.
+        occurrences (dict): A dictionary with words as keys and sequences of file-line tuples as values.
 
     Returns: dict or None: Returns an updated dictionary with occurrences if duplicates remain, or None if all
     duplicates are resolved.
@@ -135,7 +179,6 @@ def update_occurrences(directory, occurrences):
 
     line_dict = create_line_dict_from_occurrences(updated_occurrences)
     remove_unwanted_lines(directory, line_dict)
-    remove_new_lines(directory, line_dict)
 
     has_repeats, occurrences = check_repeated_columns(directory)
     if has_repeats:
@@ -157,22 +200,7 @@ def remove_unwanted_lines(directory, line_dict):
         file_path = os.path.join(directory, file_name)
 
         if os.path.exists(file_path):
-            with open(file_path, 'r') as file:
-                lines = file.readlines()
-
-            updated_lines = []
-            deleted_lines = []
-
-            for i in range(1, len(lines) + 1):
-                if i in line_nums:
-                    updated_lines.append(lines[i - 1])
-                else:
-                    if lines[i - 1].strip():
-                        deleted_lines.append(lines[i - 1].strip())
-                    updated_lines.append('\n')
-
-            with open(file_path, 'w') as file:
-                file.writelines(updated_lines)
+            deleted_lines = rewrite_file(file_path, line_nums)
 
             if deleted_lines:
                 print(f"Deleted duplicates from {file_name}: {', '.join(deleted_lines)}")
@@ -180,66 +208,70 @@ def remove_unwanted_lines(directory, line_dict):
             print(f"File {file_name} doesn't exist in {directory} directory.")
 
 
-def create_line_dict_from_occurrences(occurrences):
+def rewrite_file(file_path, keep_lines):
     """
-    Creates a dictionary mapping file names to lists of unique line numbers from occurrences.
+    Rewrites a file in a single pass, keeping only the given lines and dropping every other line.
+
+    The file is written to a temporary file next to it and then moved into place. A symbolic link is followed, so
+    that the file it points to is rewritten and the link is kept. If the last line of the file is dropped, a single
+    empty line is left at the end of the file.
 
     Args:
-        occurrences (dict): Dictionary with words as keys and lists of file-line tuples as values.
+        file_path (str): The path to the file to rewrite.
+        keep_lines (iterable): The 1-based numbers of the lines to keep.
 
     Returns:
-        dict: A dictionary with file names as keys and sorted lists of line numbers as values.
+        list: The stripped contents of the non-blank lines that were dropped.
     """
-    line_dict = {}
-
-    for word, files in occurrences.items():
-        for file_name, line_num in files:
-            if file_name not in line_dict:
-                line_dict[file_name] = []
-            if line_num not in line_dict[file_name]:
-                line_dict[file_name].append(line_num)
-
-    for file_name in line_dict:
-        line_dict[file_name].sort()
-
-    return line_dict
+    keep = frozenset(keep_lines)
+    deleted_lines = []
+    last_line_kept = True
+
+    file_path = os.path.realpath(file_path)
+    temp_fd, temp_path = tempfile.mkstemp(suffix='.tmp', dir=os.path.dirname(file_path))
+    try:
+        # The temporary file is wrapped first so that its descriptor is closed even if the input can't be opened.
+        with open(temp_fd, 'w', encoding='utf-8', buffering=_REWRITE_BUFFER_SIZE) as outfile, \
+                open(file_path, 'r', encoding='utf-8', buffering=_REWRITE_BUFFER_SIZE) as infile:
+            for line_num, line in enumerate(infile, 1):
+                last_line_kept = line_num in keep
+                if last_line_kept:
+                    outfile.write(line)
+                elif line.strip():
+                    deleted_lines.append(line.strip())
+
+            if not last_line_kept:
+                outfile.write('\n')
+
+        shutil.copymode(file_path, temp_path)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+    return deleted_lines
 
 
-def remove_new_lines(directory, line_dict):
+def create_line_dict_from_occurrences(occurrences):
     """
-    Removes new lines from files specified in line_dict, ensuring lines to keep are preserved.
+    Creates a dictionary mapping file names to lists of unique line numbers from occurrences.
 
     Args:
-        directory (str): The directory containing the files.
-        line_dict (dict): Dictionary with file names as keys and lists of line numbers to keep as values.
-    """
-    for file_name, line_nums in line_dict.items():
-        file_path = os.path.join(directory, file_name)
+        occurrences (dict): Dictionary with words as keys and lists of file-line tuples as values.
 
-        if os.path.exists(file_path):
-            with open(file_path, 'r') as file:
-                lines = file.readlines()
-
-            updated_lines = []
-            for i in range(1, len(lines) + 1):
-                if i in line_nums:
-                    updated_lines.append(lines[i - 1])
-                else:
-                    updated_lines.append('\n')
-
-            if len(updated_lines) > 0 and updated_lines[-1] == '\n':
-                updated_lines = [line for line in updated_lines if line != '\n'] + ['\n']
-            else:
-                updated_lines = [line for line in updated_lines if line != '\n']
+    Returns:
+        dict: A dictionary with file names as keys and sorted lists of line numbers as values.
+    """
+    line_dict = defaultdict(set)
 
-            with open(file_path, 'w') as file:
-                file.writelines(updated_lines)
+    for word, files in occurrences.items():
+        for file_name, line_num in files:
+            line_dict[file_name].add(line_num)
 
-        else:
-            print(f"File {file_name} doesn't exist in {directory} directory.")
+    return {file_name: sorted(line_nums) for file_name, line_nums in line_dict.items()}
 
 
-def process_file_extension(input_file_path, output_file_path, operation):
+def process_file_extension(input_file_path, output_file_path, operation, known_nonempty=False):
     """
     Process a file based on its extension and the specified operation.
 
@@ -247,6 +279,7 @@ def process_file_extension(input_file_path, output_file_path, operation):
         input_file_path (str): The path to the input file.
         output_file_path (str): The path to the output file.
         operation (str): The operation to perform ('swap_order', 'shuffle', 'format', 'add_delimiter', 'sort').
+        known_nonempty (bool, optional): True if the caller has already checked that the input file is not empty.
     """
     file_extension = os.path.splitext(input_file_path)[1].lower()
 
@@ -268,31 +301,35 @@ def process_file_extension(input_file_path, output_file_path, operation):
     }
 
     if file_extension in handlers and operation in handlers[file_extension]:
-        handlers[file_extension][operation](input_file_path, output_file_path)
+        handler = handlers[file_extension][operation]
+        if handler in _EMPTY_CHECKING_OPERATIONS:
+            handler(input_file_path, output_file_path, known_nonempty=known_nonempty)
+        else:
+            handler(input_file_path, output_file_path)
     else:
         print("Unsupported file type or operation. Only '.txt' and '.csv' files with valid operations are supported.")
 
 
-def swap_order_extension(input_file_path, output_file_path):
+def swap_order_extension(input_file_path, output_file_path, known_nonempty=False):
     """Swap the order of columns in a file based on its extension."""
-    process_file_extension(input_file_path, output_file_path, 'swap_order')
+    process_file_extension(input_file_path, output_file_path, 'swap_order', known_nonempty)
 
 
-def shuffle_file_extension(input_file_path, output_file_path):
+def shuffle_file_extension(input_file_path, output_file_path, known_nonempty=False):
     """Shuffle the contents of a file based on its extension."""
-    process_file_extension(input_file_path, output_file_path, 'shuffle')
+    process_file_extension(input_file_path, output_file_path, 'shuffle', known_nonempty)
 
 
-def format_file_extension(input_file_path, output_file_path):
+def format_file_extension(input_file_path, output_file_path, known_nonempty=False):
     """Format a file based on its extension by adding ':' and space."""
-    process_file_extension(input_file_path, output_file_path, 'format')
+    process_file_extension(input_file_path, output_file_path, 'format', known_nonempty)
 
 
-def add_delimiter_and_space_extension(input_file_path, output_file_path):
+def add_delimiter_and_space_extension(input_file_path, output_file_path, known_nonempty=False):
     """Add delimiter and space to a file based on its extension."""
-    process_file_extension(input_file_path, output_file_path, 'add_delimiter')
+    process_file_extension(input_file_path, output_file_path, 'add_delimiter', known_nonempty)
 
 
-def sort_file_extension(input_file_path, output_file_path):
+def sort_file_extension(input_file_path, output_file_path, known_nonempty=False):
     """Sort a file based on its first column."""
-    process_file_extension(input_file_path, output_file_path, 'sort')
+    process_file_extension(input_file_path, output_file_path, 'sort', known_nonempty)
@@ -1,5 +1,16 @@
+import heapq
+import io
 import os
 import random
+import re
+import tempfile
+from itertools import chain, islice
+
+_SEPARATORS_RE = re.compile(r"[;./'|\-\s]+")
+_COLON_RE = re.compile(r'\s*:\s*')
+_SEMICOLON_RE = re.compile(r'\s*;\s*')
+_EXTERNAL_SORT_THRESHOLD = 64 * 1024 * 1024
+_SORT_CHUNK_LINES = 1_000_000
 
 
 class TXTHandler:
@@ -18,42 +29,59 @@ class TXTHandler:
         Returns:
             bool: True if the word is valid, False otherwise.
         """
-        return all(w.isalpha() or w in ";./'|-" or w.isspace() for w in word)
+        letters = _SEPARATORS_RE.sub('', word)
+        return not letters or letters.isalpha()
 
     @staticmethod
-    def read_words(file_path, required_columns=1):
+    def read_words_from_fileobj(fileobj, required_columns=1):
         """
-        Read words from a TXT file.
+        Read words from a TXT file that is already open in binary mode. The file is left open.
 
         Args:
-            file_path (str): The path to the TXT file.
+            fileobj (file): The open TXT file.
             required_columns (int, optional): The number of required columns.
 
         Returns:
             list: A list of word pairs or words.
         """
+        txtfile = io.TextIOWrapper(fileobj, encoding='utf-8')
+        try:
+            return TXTHandler._parse_words(txtfile, required_columns)
+        finally:
+            txtfile.detach()
+
+    @staticmethod
+    def _parse_words(lines, required_columns):
+        """
+        Parse and validate the lines of a TXT file.
+
+        Args:
+            lines (iterable): The lines of the TXT file.
+            required_columns (int): The number of required columns.
+
+        Returns:
+            list: A list of word pairs or words, or None if a line is malformed.
+        """
         words = []
-        with open(file_path, 'r', encoding='utf-8') as txtfile:
-            for line in txtfile:
-                if not line.strip():
-                    continue
-
-                parts = line.strip().split(':')
-                if len(parts) != required_columns:
-                    print(f"TXT format error: Expected {required_columns} elements but found {len(parts)} "
-                          f"in line {line.strip()}")
-                    return
+        for line in lines:
+            if not line.strip():
+                continue
+
+            parts = line.strip().split(':')
+            if len(parts) != required_columns:
+                print(f"TXT format error: Expected {required_columns} elements but found {len(parts)} "
+                      f"in line {line.strip()}")
+                return
 
-                word = parts[0]
-                translations = parts[1] if required_columns == 2 else ''
+            word = parts[0]
+            translations = parts[1] if required_columns == 2 else ''
 
-                if not TXTHandler._is_valid_word(word) or (required_columns == 2 and
-                                                           not TXTHandler._is_valid_word(
-                                                               translations.replace(';', ''))):
-                    print(f"TXT format error: Invalid characters in line {line.strip()}")
-                    return
+            if not TXTHandler._is_valid_word(word) or (required_columns == 2 and
+                                                       not TXTHandler._is_valid_word(translations.replace(';', ''))):
+                print(f"TXT format error: Invalid characters in line {line.strip()}")
+                return
 
-                words.append((word, translations) if required_columns == 2 else word)
+            words.append((word, translations) if required_columns == 2 else word)
 
         return words
 
@@ -67,12 +95,10 @@ class TXTHandler:
             output_file_path (str): The path to the output TXT file.
         """
         with open(output_file_path, 'w', encoding='utf-8') as txtfile:
-            for word, translation in translations.items():
-                txtfile.write(f"{word}: {translation}\n")
-                txtfile.flush()
+            txtfile.write(''.join([f"{word}: {translation}\n" for word, translation in translations.items()]))
 
     @staticmethod
-    def swap_order_txt(input_filename, output_filename, delimiter=':'):
+    def swap_order_txt(input_filename, output_filename, delimiter=':', known_nonempty=False):
         """
         Swap the order of columns in a TXT file.
 
@@ -80,14 +106,17 @@ class TXTHandler:
             input_filename (str): The path to the input TXT file.
             output_filename (str): The path to the output TXT file.
             delimiter (str, optional): The delimiter separating the columns in the TXT file.
+            known_nonempty (bool, optional): True if the caller has already checked that the file exists and is not
+                empty.
         """
-        if not os.path.exists(input_filename):
-            print(f"Error: Input file '{input_filename}' does not exist.")
-            return
+        if not known_nonempty:
+            if not os.path.exists(input_filename):
+                print(f"Error: Input file '{input_filename}' does not exist.")
+                return
 
-        if os.path.getsize(input_filename) == 0:
-            print(f"Error: The file '{input_filename}' is empty.")
-            return
+            if os.path.getsize(input_filename) == 0:
+                print(f"Error: The file '{input_filename}' is empty.")
+                return
 
         all_rows_valid = True
         temp_output = []
@@ -106,9 +135,7 @@ class TXTHandler:
 
             if all_rows_valid:
                 with open(output_filename, 'w', encoding='utf-8') as outfile:
-                    for line in temp_output:
-                        outfile.write(line + '\n')
-                        outfile.flush()
+                    outfile.writelines(line + '\n' for line in temp_output)
 
             print(f"File '{input_filename}' has been reversed and saved as '{output_filename}'")
 
@@ -139,7 +166,6 @@ class TXTHandler:
 
             with open(output_file_path, 'w', encoding='utf-8') as outfile:
                 outfile.writelines(lines)
-                outfile.flush()
 
             print(f'File {input_file_path} has been shuffled and saved as {output_file_path}')
 
@@ -158,24 +184,22 @@ class TXTHandler:
         """
         try:
             with open(input_file_path, 'r', encoding='utf-8') as infile:
-                lines = infile.readlines()
-                if not lines:
+                first_line = infile.readline()
+                if not first_line:
                     print(f"Error: The file '{input_file_path}' is empty.")
                     return
 
-            formatted_lines = set()
+                # A dict keeps the first occurrence of each line in file order, unlike a set.
+                formatted_lines = {}
 
-            for line in lines:
-                formatted_line = ': '.join([segment.strip() for segment in line.split(':')])
-                formatted_line = '; '.join([segment.strip() for segment in formatted_line.split(';')])
+                for line in chain([first_line], infile):
+                    formatted_line = _SEMICOLON_RE.sub('; ', _COLON_RE.sub(': ', line.strip()).strip())
 
-                if formatted_line.strip():
-                    formatted_lines.add(formatted_line)
+                    if formatted_line:
+                        formatted_lines[formatted_line] = None
 
             with open(output_file_path, 'w', encoding='utf-8') as outfile:
-                for formatted_line in formatted_lines:
-                    outfile.write(formatted_line + '\n')
-                    outfile.flush()
+                outfile.writelines(formatted_line + '\n' for formatted_line in formatted_lines)
 
             print(f"File '{input_file_path}' has been formatted and saved as '{output_file_path}'")
 
@@ -193,18 +217,13 @@ class TXTHandler:
         """
         try:
             with open(input_file_path, 'r', encoding='utf-8') as infile:
-                lines = infile.readlines()
-                if not lines:
+                first_line = infile.readline()
+                if not first_line:
                     print(f"Error: The file '{input_file_path}' is empty.")
                     return
 
-            with open(output_file_path, 'w', encoding='utf-8') as outfile:
-                for line in lines:
-                    trimmed_line = line.strip()
-                    if trimmed_line:
-                        new_line = f"{trimmed_line}: \n"
-                        outfile.write(new_line)
-                        outfile.flush()
+                with open(output_file_path, 'w', encoding='utf-8') as outfile:
+                    outfile.writelines(f"{line.strip()}: \n" for line in chain([first_line], infile) if line.strip())
 
             print(f"File '{input_file_path}' has been processed and saved as '{output_file_path}'")
 
@@ -221,23 +240,67 @@ class TXTHandler:
             output_file_path (str): The path to the output TXT file.
         """
         try:
-            with open(input_file_path, 'r', encoding='utf-8') as infile:
-                lines = infile.readlines()
-
-            lines = [line.strip() for line in lines if line.strip()]
+            if os.path.getsize(input_file_path) > _EXTERNAL_SORT_THRESHOLD:
+                if not TXTHandler._external_sort_txt(input_file_path, output_file_path):
+                    print(f"Error: The file '{input_file_path}' is empty.")
+                    return
+            else:
+                with open(input_file_path, 'r', encoding='utf-8') as infile:
+                    lines = [stripped_line for line in infile if (stripped_line := line.strip())]
 
-            if not lines:
-                print(f"Error: The file '{input_file_path}' is empty.")
-                return
+                if not lines:
+                    print(f"Error: The file '{input_file_path}' is empty.")
+                    return
 
-            lines.sort(key=lambda line: line.strip().lower())
+                lines.sort(key=str.lower)
 
-            with open(output_file_path, 'w', encoding='utf-8') as outfile:
-                for line in lines:
-                    outfile.write(line + '\n')
-                    outfile.flush()
+                with open(output_file_path, 'w', encoding='utf-8') as outfile:
+                    outfile.writelines(line + '\n' for line in lines)
 
             print(f"File '{input_file_path}' has been sorted and saved as '{output_file_path}'")
 
         except Exception as e:
             print(f"An error occurred: {e}")
+
+    @staticmethod
+    def _external_sort_txt(input_file_path, output_file_path):
+        """
+        Sort the lines of a TXT file that is too large to sort in memory.
+
+        The file is sorted in chunks that are spilled to temporary files and then merged. Both the chunk sorts and
+        the merge are stable, so the result is the same as sorting the whole file at once.
+
+        Args:
+            input_file_path (str): The path to the input TXT file.
+            output_file_path (str): The path to the output TXT file.
+
+        Returns:
+            bool: True if the file had any non-blank lines to sort, False otherwise.
+        """
+        chunk_files = []
+        try:
+            with open(input_file_path, 'r', encoding='utf-8') as infile:
+                while lines := list(islice(infile, _SORT_CHUNK_LINES)):
+                    chunk = [stripped_line for line in lines if (stripped_line := line.strip())]
+                    if not chunk:
+                        continue
+
+                    chunk.sort(key=str.lower)
+
+                    chunk_file = tempfile.TemporaryFile('w+', encoding='utf-8')
+                    chunk_files.append(chunk_file)
+                    chunk_file.writelines(line + '\n' for line in chunk)
+                    chunk_file.seek(0)
+
+            if not chunk_files:
+                return False
+
+            # The newlines are removed before merging so that they don't take part in the comparisons.
+            chunks = [(line[:-1] for line in chunk_file) for chunk_file in chunk_files]
+            with open(output_file_path, 'w', encoding='utf-8') as outfile:
+                outfile.writelines(line + '\n' for line in heapq.merge(*chunks, key=str.lower))
+
+            return True
+        finally:
+            for chunk_file in chunk_files:
+                chunk_file.close()
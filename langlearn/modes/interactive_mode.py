@@ -3,7 +3,8 @@ import csv
 
 from termcolor import colored
 
-from langlearn.utils.file_utils import is_file_valid
+from langlearn.utils.console_utils import enable_color
+from langlearn.utils.file_utils import is_file_valid, TXT_EXTS
 
 
 class InteractiveMode:
@@ -18,9 +19,10 @@ class InteractiveMode:
         Args:
             input_filename (str): The path to the file to search in.
         """
-        if not is_file_valid(input_filename, True):
+        if not is_file_valid(input_filename, TXT_EXTS):
             return
 
+        enable_color()
         print(f"Interactive mode: Searching in file '{input_filename}'")
 
         while True:
@@ -42,32 +44,23 @@ class InteractiveMode:
         """
         found = False
         file_extension = os.path.splitext(input_filename)[1].lower()
-        os.system('color')
 
         with open(input_filename, 'r', encoding='utf-8') as infile:
+            # The substring checks are cheap and skip splitting the first column of rows that cannot match.
             if file_extension == '.csv':
                 reader = csv.reader(infile)
                 for row in reader:
-                    if row:
-                        first_column_words = [w.strip() for w in row[0].split(';')]
-                        if word in first_column_words:
-                            formatted_row = ', '.join(row)
-                            print(colored(formatted_row, 'blue'))
-                            found = True
+                    if row and word in row[0] and word in (w.strip() for w in row[0].split(';')):
+                        formatted_row = ', '.join(row)
+                        print(colored(formatted_row, 'blue'))
+                        found = True
             else:
                 for line in infile:
                     line = line.strip()
-                    if line:
-                        if ':' in line:
-                            parts = line.split(':', 1)
-                            line = f"{parts[0]}:{colored(parts[1], 'blue')}"
-                        else:
-                            parts = [line]
-
-                        first_column_words = [w.strip() for w in parts[0].split(';')] if len(parts) > 0 else []
-                        if word in first_column_words:
-                            print(line)
-                            found = True
+                    first_column, separator, translation = line.partition(':')
+                    if line and word in first_column and word in (w.strip() for w in first_column.split(';')):
+                        print(f"{first_column}:{colored(translation, 'blue')}" if separator else line)
+                        found = True
 
         if not found:
             print(f"No occurrences of '{word}' found.")
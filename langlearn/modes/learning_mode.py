@@ -3,7 +3,8 @@ import random
 
 from termcolor import colored
 
-from langlearn.utils.file_utils import read_words_from_file, write_translations_to_file, is_file_valid
+from langlearn.utils.console_utils import enable_color
+from langlearn.utils.file_utils import open_valid, read_words_from_fileobj, write_translations_to_file
 
 
 class LearningMode:
@@ -12,6 +13,11 @@ class LearningMode:
     where users can learn translations from a given file.
     """
 
+    _cached_path = None
+    _cached_key = None
+    _cached_words = None
+    _removed_words = {}
+
     @staticmethod
     def run(input_file_path):
         """
@@ -21,73 +27,112 @@ class LearningMode:
             input_file_path (str): The path to the input file containing word pairs.
         """
 
-        if not is_file_valid(input_file_path):
+        words = LearningMode.read_words(input_file_path)
+        if not words:
             return
 
-        LearningMode.learn_words(input_file_path)
+        enable_color()
+        LearningMode.learn_words(input_file_path, words)
 
     @staticmethod
-    def learn_words(input_file_path):
+    def learn_words(input_file_path, words=None):
         """
-        Facilitates the learning process, prompting the user to translate words.
+        Facilitates the learning process, prompting the user to translate words. The words the user chose to
+        remove are written out when the session ends, however it ends.
 
         Args:
             input_file_path (str): The path to the input file containing word pairs.
+            words (list, optional): The word pairs already read from the file. They are read here if not given.
         """
-        known_words = set()
-        no_know_words = 0
-        last_word_pair = None
-        words = LearningMode.read_words(input_file_path)
+        last_index = None
+        if words is None:
+            words = LearningMode.read_words(input_file_path)
         if not words:
             return
-        no_all_words = len(words)
+        remaining_indices = list(range(len(words)))
 
-        while True:
-            if not words:
-                words = LearningMode.read_words(input_file_path)
+        try:
+            while True:
                 if not words:
-                    return
-
-            if no_all_words == no_know_words:
-                if not LearningMode.reload_words():
-                    break
-                else:
                     words = LearningMode.read_words(input_file_path)
                     if not words:
-                        print('There are no words left.')
                         return
-                known_words.clear()
-                no_all_words = len(words)
-                no_know_words = 0
-                last_word_pair = None
-                continue
-
-            word_pair = LearningMode.select_word_pair(words, known_words, last_word_pair)
-            last_word_pair = word_pair
-
-            if LearningMode.handle_translation(word_pair, known_words, input_file_path):
-                no_know_words += 1
+                    remaining_indices = list(range(len(words)))
+
+                if not remaining_indices:
+                    if not LearningMode.reload_words():
+                        break
+                    else:
+                        # The words left after the removals are used as they are, since reading back a file that
+                        # the removals emptied would report it as an error.
+                        words = LearningMode.flush_removed_words(input_file_path)
+                        if words is None:
+                            words = LearningMode.read_words(input_file_path)
+                        if not words:
+                            print('There are no words left.')
+                            return
+                    remaining_indices = list(range(len(words)))
+                    last_index = None
+                    continue
+
+                position = LearningMode.select_word_pair(remaining_indices, last_index)
+                index = last_index = remaining_indices[position]
+
+                if LearningMode.handle_translation(words[index], input_file_path):
+                    # The order of the remaining words doesn't matter, so the learned one is swapped with the last
+                    # one and popped instead of being removed from the middle of the list.
+                    remaining_indices[position] = remaining_indices[-1]
+                    remaining_indices.pop()
+        finally:
+            LearningMode.flush_removed_words(input_file_path)
 
     @staticmethod
     def read_words(input_file_path):
         """
-        Reads word pairs from the input file and trims spaces around the words.
+        Validates the input file, then reads word pairs from it and trims spaces around the words.
+        The file is validated and read through a single open, and the parsed pairs are cached and reused for as long
+        as the file is unchanged.
 
         Args:
             input_file_path (str): The path to the input file.
 
         Returns:
-            list: A list of word pairs.
+            list: A list of (word, translations) tuples.
         """
         try:
-            words = read_words_from_file(input_file_path, 2)
+            with open_valid(input_file_path) as (fileobj, file_info):
+                if fileobj is None:
+                    return
+
+                cache_key = (file_info.mtime_ns, file_info.size)
+                if input_file_path == LearningMode._cached_path and cache_key == LearningMode._cached_key:
+                    return list(LearningMode._cached_words)
+
+                words = read_words_from_fileobj(fileobj, file_info, 2)
+
             if not words:
                 return
-            return [[w.strip() for w in pair] for pair in words]
+            words = [(word.strip(), translations.strip()) for word, translations in words]
+            LearningMode._cache_words(input_file_path, cache_key, words)
+            return words
         except Exception as e:
             print(f"Error reading file: {e}")
             return []
 
+    @staticmethod
+    def _cache_words(input_file_path, cache_key, words):
+        """
+        Stores the word pairs read from a file so that unchanged files are not parsed again.
+
+        Args:
+            input_file_path (str): The path to the file the words belong to.
+            cache_key (tuple): The file's (mtime_ns, size) at the time the words were read or written.
+            words (iterable): The (word, translations) tuples in the file.
+        """
+        LearningMode._cached_path = input_file_path
+        LearningMode._cached_key = cache_key
+        LearningMode._cached_words = tuple(words)
+
     @staticmethod
     def reload_words():
         """
@@ -104,36 +149,33 @@ class LearningMode:
         return False
 
     @staticmethod
-    def select_word_pair(words, known_words, last_word_pair):
+    def select_word_pair(remaining_indices, last_index):
         """
-        Selects a word pair from the list of words that hasn't been learned yet.
+        Selects a word pair that hasn't been learned yet, avoiding the last one presented whenever another pair
+        is available.
 
         Args:
-            words (list): The list of word pairs.
-            known_words (set): The set of known word pairs.
-            last_word_pair (list): The last word pair that was presented.
+            remaining_indices (list): The indices of the word pairs that haven't been learned yet.
+            last_index (int): The index of the last word pair that was presented.
 
         Returns:
-            list: The selected word pair.
+            int: The position in remaining_indices of the selected word pair.
         """
-        remaining_words = [tuple(word_pair) for word_pair in words if tuple(word_pair) not in known_words]
+        position = random.randrange(len(remaining_indices))
 
-        if len(remaining_words) == 1:
-            return remaining_words[0]
-
-        word_pair = random.choice(words)
-        while tuple(word_pair) in known_words or word_pair == last_word_pair:
-            word_pair = random.choice(words)
-        return word_pair
+        if remaining_indices[position] == last_index and len(remaining_indices) > 1:
+            position = random.randrange(len(remaining_indices) - 1)
+            if remaining_indices[position] == last_index:
+                position = len(remaining_indices) - 1
+        return position
 
     @staticmethod
-    def handle_translation(word_pair, known_words, input_file_path):
+    def handle_translation(word_pair, input_file_path):
         """
         Handles the translation process, checking if the user's translation is correct.
 
         Args:
-            word_pair (list): The word pair to be translated.
-            known_words (set): The set of known word pairs.
+            word_pair (tuple): The word pair to be translated.
             input_file_path (str): The path to the input file containing word pairs.
 
         Returns:
@@ -143,7 +185,6 @@ class LearningMode:
         correct_translations = [t.strip() for t in correct_translations]
 
         user_translation = input(f"Translate '{original_word}': ").strip().lower()
-        os.system('color')
 
         if user_translation in correct_translations:
             print(colored("Correct!", 'green'))
@@ -151,8 +192,7 @@ class LearningMode:
             if additional_translations:
                 print(f"Other correct translations: {', '.join(additional_translations)}")
             if LearningMode.prompt_remove_word(word_pair, input_file_path):
-                print(f"'{original_word}' removed from file.")
-            known_words.add(tuple(word_pair))
+                print(f"'{original_word}' will be removed from file when the words are reloaded or the session ends.")
             return True
         else:
             print(f"{colored('Incorrect.', 'red')} Correct translations: {', '.join(correct_translations)}")
@@ -162,9 +202,10 @@ class LearningMode:
     def prompt_remove_word(word_pair, input_file_path):
         """
         Prompts the user to remove a word pair from the file if it has been correctly translated.
+        The removal is only recorded here; flush_removed_words writes all recorded removals at once.
 
         Args:
-            word_pair (list): The word pair to be removed.
+            word_pair (tuple): The word pair to be removed.
             input_file_path (str): The path to the input file containing word pairs.
 
         Returns:
@@ -172,18 +213,42 @@ class LearningMode:
         """
         response = input("Remove this word from the file? (y/Y for yes): ").strip().lower()
         if response == 'y':
-            try:
-                file_words = LearningMode.read_words(input_file_path)
-                if not file_words:
-                    return
-                file_words = [[w.strip() for w in pair] for pair in file_words]
-                word_pair_list = [w.strip() for w in word_pair]
-                if word_pair_list in file_words:
-                    file_words.remove(word_pair_list)
-                    write_translations_to_file(dict(file_words), input_file_path)
-                    return True
-                else:
-                    print(f"Word pair '{word_pair}' not found in file.")
-            except Exception as e:
-                print(f"Error writing to file: {e}")
+            LearningMode._removed_words.setdefault(input_file_path, set()).add(word_pair)
+            return True
         return False
+
+    @staticmethod
+    def flush_removed_words(input_file_path):
+        """
+        Rewrites the input file without the word pairs the user chose to remove, if there are any, and reports
+        which words were removed or that the removal failed.
+
+        Args:
+            input_file_path (str): The path to the input file containing word pairs.
+
+        Returns:
+            list: The (word, translations) tuples left in the file once the words were removed, or None if there
+            was nothing to remove or the removal failed.
+        """
+        removed_words = LearningMode._removed_words.pop(input_file_path, None)
+        if not removed_words:
+            return
+
+        removed_list = ', '.join(sorted(word for word, _ in removed_words))
+        try:
+            file_words = LearningMode.read_words(input_file_path)
+            if not file_words:
+                print(f"Error: Could not read '{input_file_path}'. Words not removed: {removed_list}")
+                return
+            translations = dict(pair for pair in file_words if pair not in removed_words)
+            write_translations_to_file(translations, input_file_path)
+
+            remaining_words = list(translations.items())
+            file_stat = os.stat(input_file_path)
+            LearningMode._cache_words(input_file_path, (file_stat.st_mtime_ns, file_stat.st_size), remaining_words)
+        except Exception as e:
+            print(f"Error writing to file: {e}. Words not removed: {removed_list}")
+            return
+
+        print(f"Removed from '{input_file_path}': {removed_list}")
+        return remaining_words
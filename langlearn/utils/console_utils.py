@@ -0,0 +1,20 @@
+import os
+import sys
+
+_color_enabled = False
+
+
+def enable_color():
+    """
+    Enables coloured console output.
+
+    On Windows, running the 'color' command switches the console into a mode that understands the ANSI escape
+    codes produced by termcolor. The mode lasts for the rest of the process, so the command is only run once.
+    Other platforms support the escape codes already and need nothing.
+    """
+    global _color_enabled
+
+    if not _color_enabled:
+        if sys.platform == 'win32':
+            os.system('color')
+        _color_enabled = True
@@ -1,27 +1,70 @@
+import logging
 import os
+import stat
+from collections import namedtuple
+from contextlib import contextmanager
+from functools import lru_cache
 
-from langlearn.file_handlers.csv_handler import CSVHandler
-from langlearn.file_handlers.txt_handler import TXTHandler
+logger = logging.getLogger(__name__)
 
 
-def read_words_from_file(file_path, required_columns=1):
+@lru_cache(maxsize=None)
+def _csv_handler():
+    """Import the CSV handler the first time a CSV file is read or written."""
+    from langlearn.file_handlers.csv_handler import CSVHandler
+    return CSVHandler
+
+
+@lru_cache(maxsize=None)
+def _txt_handler():
+    """Import the TXT handler the first time a TXT file is read or written."""
+    from langlearn.file_handlers.txt_handler import TXTHandler
+    return TXTHandler
+
+
+_HANDLERS = {'.csv': _csv_handler, '.txt': _txt_handler}
+_VALID_EXTS = frozenset(_HANDLERS)
+TXT_EXTS = frozenset({'.txt'})
+
+
+def _ext(path):
     """
-    Read words from a file.
+    Returns the extension of a path, with the same rules as os.path.splitext but without splitting off the rest.
 
     Args:
-        file_path (str): The path to the file.
-        required_columns (int, optional): The number of required columns.
+        path (str): The path to take the extension from.
 
     Returns:
-        list: A list of words or word pairs.
+        str: The extension including the leading '.', or '' if the path has none. Leading dots of the file name,
+        as in '.txt', do not start an extension.
     """
-    file_extension = os.path.splitext(file_path)[1].lower()
-    if file_extension == '.csv':
-        return CSVHandler.read_words(file_path, required_columns)
-    elif file_extension == '.txt':
-        return TXTHandler.read_words(file_path, required_columns)
-    else:
-        print(f"Unsupported file type: {file_extension}")
+    sep_index = path.rfind(os.sep)
+    if os.altsep:
+        sep_index = max(sep_index, path.rfind(os.altsep))
+
+    dot_index = path.rfind('.')
+    if dot_index > sep_index and path[sep_index + 1:dot_index].strip('.'):
+        return path[dot_index:]
+    return ''
+
+
+class FileInfo(namedtuple('FileInfo', 'ok ext size mtime_ns')):
+    """
+    The result of validating a file, carrying what was learned about it so that callers don't need to stat it again.
+
+    Attributes:
+        ok (bool): True if the file is valid, False otherwise. The object itself is truthy only if the file is valid.
+        ext (str): The file extension, or '' if the file is not valid.
+        size (int): The file size in bytes, or 0 if the file is not valid.
+        mtime_ns (int): The file's modification time in nanoseconds, or 0 if the file is not valid.
+    """
+    __slots__ = ()
+
+    def __bool__(self):
+        return self.ok
+
+
+_INVALID_FILE = FileInfo(False, '', 0, 0)
 
 
 def write_translations_to_file(translations, output_file_path):
@@ -32,46 +75,140 @@ def write_translations_to_file(translations, output_file_path):
         translations (dict): A dictionary of translations.
         output_file_path (str): The path to the output file.
     """
-    file_extension = os.path.splitext(output_file_path)[1].lower()
-    if file_extension == '.csv':
-        CSVHandler.write_words(translations, output_file_path)
-    elif file_extension == '.txt':
-        TXTHandler.write_words(translations, output_file_path)
+    file_extension = _ext(output_file_path).lower()
+    handler = _HANDLERS.get(file_extension)
+    if handler:
+        handler().write_words(translations, output_file_path)
     else:
-        print(f"Unsupported file type: {file_extension}")
+        logger.error("Unsupported file type: %s", file_extension)
 
 
-def is_file_valid(input_file_path, txt_file=False):
+def is_file_valid(input_file_path, allowed=_VALID_EXTS):
     """
     Checks if the specified file is valid for processing.
 
     Args:
         input_file_path (str): The path to the file to be checked.
-        txt_file (bool, optional): bool: True if input_file_path has to be text file, False otherwise.
+        allowed (frozenset, optional): The accepted extensions; TXT_EXTS to accept only text files. Defaults to
+            every supported extension.
 
     Returns:
-        bool: True if the file is valid (exists, has a valid extension, and is not empty), False otherwise.
+        FileInfo: The file's extension, size and modification time. It is truthy if the file is valid (exists, has a
+        valid extension, and is not empty) and falsy otherwise.
     """
-    if not os.path.isfile(input_file_path):
-        print(f"Error: The file '{input_file_path}' does not exist.")
-        return False
+    try:
+        file_stat = os.stat(input_file_path)
+    except OSError:
+        file_stat = None
 
-    base, file_extension = os.path.splitext(input_file_path)
+    return _check_file(input_file_path, file_stat, allowed)
+
+
+@contextmanager
+def open_valid(input_file_path, allowed=_VALID_EXTS):
+    """
+    Opens a file for reading and validates it through the open descriptor, so that the file that was checked is
+    the file that gets read and no second stat call is needed.
+
+    Args:
+        input_file_path (str): The path to the file to be opened.
+        allowed (frozenset, optional): The accepted extensions. Defaults to every supported extension.
+
+    Yields:
+        tuple: (fileobj, file_info), where fileobj is the file open in binary mode, or None if the file is not
+        valid, and file_info is the FileInfo for it as returned by is_file_valid.
+    """
+    # O_NONBLOCK keeps the open from waiting for a writer when the path is a FIFO; such paths are then rejected by
+    # the regular-file check before anything is read.
+    flags = os.O_RDONLY | getattr(os, 'O_NONBLOCK', 0) | getattr(os, 'O_BINARY', 0)
+    try:
+        fd = os.open(input_file_path, flags)
+    except OSError:
+        yield None, _check_file(input_file_path, None, allowed)
+        return
+
+    try:
+        file_info = _check_file(input_file_path, os.fstat(fd), allowed)
+    except BaseException:
+        os.close(fd)
+        raise
+
+    if not file_info:
+        os.close(fd)
+        yield None, file_info
+        return
+
+    with open(fd, 'rb') as fileobj:
+        yield fileobj, file_info
+
+
+def read_words_from_fileobj(fileobj, file_info, required_columns=1):
+    """
+    Reads words from a file opened by open_valid.
+
+    Args:
+        fileobj (file): The file, open in binary mode.
+        file_info (FileInfo): The FileInfo yielded together with the file.
+        required_columns (int, optional): The number of required columns.
+
+    Returns:
+        list: A list of words or word pairs.
+    """
+    if hasattr(os, 'posix_fadvise'):
+        # The whole file is about to be read front to back, so let the kernel read ahead aggressively.
+        os.posix_fadvise(fileobj.fileno(), 0, file_info.size, os.POSIX_FADV_SEQUENTIAL)
+        os.posix_fadvise(fileobj.fileno(), 0, file_info.size, os.POSIX_FADV_WILLNEED)
+    return _HANDLERS[file_info.ext]().read_words_from_fileobj(fileobj, required_columns)
+
+
+def _check_file(input_file_path, file_stat, allowed):
+    """
+    Validates a file from its path and stat result, logging the reason if it is not valid.
+
+    Args:
+        input_file_path (str): The path to the file to be checked.
+        file_stat (os.stat_result): The result of stat'ing the file, or None if it could not be stat'ed.
+        allowed (frozenset): The accepted extensions, a subset of the supported ones.
+
+    Returns:
+        FileInfo: The file's extension, size and modification time; falsy if the file is not valid.
+    """
+    if file_stat is None or not stat.S_ISREG(file_stat.st_mode):
+        logger.error("Error: The file '%s' does not exist.", input_file_path)
+        return _INVALID_FILE
+
+    file_extension = _ext(input_file_path)
 
     if not file_extension:
-        print("Error: The input file must have a valid extension.")
-        return False
-    elif file_extension not in ['.txt', '.csv']:
-        print(f"Unsupported file extension: {file_extension}")
-        return False
-
-    if txt_file:
-        if not input_file_path.endswith('.txt'):
-            print(f"Unsupported file extension: {file_extension}")
-            return False
-
-    if not os.path.getsize(input_file_path):
-        print(f"Error: The file '{input_file_path}' is empty.")
-        return False
-
-    return True
+        logger.error("Error: The input file must have a valid extension.")
+        return _INVALID_FILE
+    elif file_extension not in allowed:
+        logger.error("Unsupported file extension: %s", file_extension)
+        return _INVALID_FILE
+
+    if not file_stat.st_size:
+        logger.error("Error: The file '%s' is empty.", input_file_path)
+        return _INVALID_FILE
+
+    return FileInfo(True, file_extension, file_stat.st_size, file_stat.st_mtime_ns)
+
+
+def iter_valid_files(root, allowed=_VALID_EXTS):
+    """
+    Yields the paths of the non-empty files in a directory that have one of the given extensions.
+
+    The file type comes from the directory listing itself on most platforms, so only files with an accepted
+    extension are stat'ed, and each of them only once.
+
+    Args:
+        root (str): The directory to list.
+        allowed (frozenset, optional): The accepted extensions; TXT_EXTS to accept only text files. Defaults to
+            every supported extension.
+
+    Yields:
+        str: The path of each matching file, in directory order.
+    """
+    with os.scandir(root) as it:
+        for entry in it:
+            if _ext(entry.name) in allowed and entry.is_file() and entry.stat().st_size:
+                yield entry.path
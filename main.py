@@ -1,7 +1,11 @@
+import logging
+import sys
+
 from langlearn.app.langlearn_app import LanglearnApp
 
 
 def main():
+    logging.basicConfig(format='%(message)s', stream=sys.stdout)
     app = LanglearnApp()
     app.run()
 